@@ -1,59 +1,94 @@
+import networkx as nx
 import numpy as np
 from collections import Counter
 
 
+def _generator_stats(gen):
+    node_types = gen.config.node_types
+    relation_types = gen.config.relation_types
+
+    node_type_counts = np.bincount(
+        gen.node_type_ids, minlength=len(node_types)
+    )
+    edge_type_counts = np.bincount(
+        gen.edge_type_ids, minlength=len(relation_types)
+    )
+
+    # in-degree + out-degree, same as nx.DiGraph.degree()
+    degrees = np.bincount(
+        gen.edge_index.ravel(), minlength=len(gen.node_type_ids)
+    )
+
+    return (
+        {k: v for k, v in zip(node_types, node_type_counts.tolist()) if v},
+        {k: v for k, v in zip(relation_types, edge_type_counts.tolist()) if v},
+        degrees,
+        int(gen.attack_node.sum()),
+        int(gen.attack_edge.sum()),
+    )
+
+
+def _networkx_stats(graph):
+    degrees = np.fromiter(
+        (deg for _, deg in graph.degree()),
+        dtype=np.int64,
+        count=graph.number_of_nodes(),
+    )
+
+    return (
+        Counter(t for _, t in graph.nodes(data="node_type")),
+        Counter(t for _, _, t in graph.edges(data="edge_type")),
+        degrees,
+        sum(a for _, a in graph.nodes(data="attack_node")),
+        sum(a for _, _, a in graph.edges(data="attack_edge")),
+    )
+
+
+# Accepts either an EnterpriseGraphGenerator or the nx.DiGraph
+# returned by its to_networkx()
 def analyze_graph(graph, name="Graph"):
     print(f"\n===== {name} Distribution Analysis =====")
 
+    if isinstance(graph, nx.Graph):
+        stats = _networkx_stats(graph)
+    else:
+        stats = _generator_stats(graph)
+    (
+        node_type_counts,
+        edge_type_counts,
+        degrees,
+        attack_nodes,
+        attack_edges,
+    ) = stats
+
+    total_nodes = len(degrees)
+    total_edges = sum(edge_type_counts.values())
+
     # -----------------------------
     # Node Type Distribution
     # -----------------------------
-    node_types = [
-        data["node_type"]
-        for _, data in graph.nodes(data=True)
-    ]
-    node_type_counts = Counter(node_types)
-
     print("\nNode Type Distribution:")
-    total_nodes = graph.number_of_nodes()
     for k, v in node_type_counts.items():
         print(f"{k}: {v} ({v/total_nodes:.2%})")
 
     # -----------------------------
     # Edge Type Distribution
     # -----------------------------
-    edge_types = [
-        data["edge_type"]
-        for _, _, data in graph.edges(data=True)
-    ]
-    edge_type_counts = Counter(edge_types)
-
     print("\nEdge Type Distribution:")
-    total_edges = graph.number_of_edges()
     for k, v in edge_type_counts.items():
         print(f"{k}: {v} ({v/total_edges:.2%})")
 
     # -----------------------------
     # Degree Statistics
     # -----------------------------
-    degrees = [deg for _, deg in graph.degree()]
     print("\nDegree Statistics:")
-    print(f"Average Degree: {np.mean(degrees):.2f}")
-    print(f"Max Degree: {np.max(degrees)}")
-    print(f"Min Degree: {np.min(degrees)}")
+    print(f"Average Degree: {degrees.mean():.2f}")
+    print(f"Max Degree: {degrees.max()}")
+    print(f"Min Degree: {degrees.min()}")
 
     # -----------------------------
     # Attack Ratios
     # -----------------------------
-    attack_nodes = sum(
-        data["attack_node"]
-        for _, data in graph.nodes(data=True)
-    )
-    attack_edges = sum(
-        data["attack_edge"]
-        for _, _, data in graph.edges(data=True)
-    )
-
     print("\nAttack Statistics:")
     print(
         f"Attack Nodes: {attack_nodes} "
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -28,6 +28,9 @@ class EnterpriseConfig:
     # Features
     feature_dimensions: int
 
+    # RNG seed for the generator (None = fresh entropy)
+    seed: Optional[int] = None
+
 
 # ✅ ENTERPRISE A CONFIG
 enterprise_A_config = EnterpriseConfig(
@@ -102,6 +105,8 @@ enterprise_A_config = EnterpriseConfig(
     },
 
     feature_dimensions=16,
+
+    seed=42,
 )
 # ✅ ENTERPRISE B CONFIG
 enterprise_B_config = EnterpriseConfig(
@@ -171,6 +176,8 @@ enterprise_B_config = EnterpriseConfig(
     },
 
     feature_dimensions=16,
+
+    seed=43,
 )
 # ✅ ENTERPRISE C CONFIG
 enterprise_C_config = EnterpriseConfig(
@@ -239,4 +246,6 @@ enterprise_C_config = EnterpriseConfig(
     },
 
     feature_dimensions=16,
+
+    seed=44,
 )
\ No newline at end of file
@@ -12,7 +12,7 @@ from train import train, evaluate
 
 def prepare_data(config):
     gen = EnterpriseGraphGenerator(config)
-    graph = gen.generate()
+    gen.generate()
     return gen.to_pyg()
 
 
@@ -4,14 +4,14 @@ from config import enterprise_A_config
 
 def export_ultra_format():
     gen = EnterpriseGraphGenerator(enterprise_A_config)
-    graph = gen.generate()
+    gen.generate()
+    graph = gen.to_networkx()
 
     triplets = []
     entities = set()
     relations = set()
 
-    for u, v, data in graph.edges(data=True):
-        r = data["edge_type"]
+    for u, v, r in graph.edges(data="edge_type"):
         triplets.append((str(u), r, str(v)))
         entities.add(str(u))
         entities.add(str(v))
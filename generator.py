@@ -1,4 +1,3 @@
-import random
 from typing import Dict, List, Tuple
 
 import networkx as nx
@@ -9,11 +8,32 @@ from torch_geometric.data import Data
 from config import EnterpriseConfig
 
 
+# Uniform (src, dst) pairs over node ids, samples_per_type for each
+# edge type in one batch, self-loops dropped
+def _sample_edges(
+    rng: np.random.Generator,
+    num_nodes: int,
+    num_types: int,
+    samples_per_type: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    total = num_types * samples_per_type
+    srcs = rng.integers(0, num_nodes, size=total)
+    dsts = rng.integers(0, num_nodes, size=total)
+    edge_types = np.repeat(
+        np.arange(num_types, dtype=np.int8), samples_per_type
+    )
+
+    keep = srcs != dsts
+    return srcs[keep], dsts[keep], edge_types[keep]
+
+
 class EnterpriseGraphGenerator:
     def __init__(self, config: EnterpriseConfig):
         self.config = config
-        self.graph = nx.DiGraph()
+        self.rng = np.random.default_rng(config.seed)
         self.node_id_counter = 0
+        self._nodes_by_type: Dict[str, List[int]] = {}
+        self.attack_instances: List[dict] = []
 
         self.node_type_encoding = {
             t: i for i, t in enumerate(config.node_types)
@@ -22,202 +42,283 @@ class EnterpriseGraphGenerator:
             t: i for i, t in enumerate(config.relation_types)
         }
 
+        # Inverse of the encodings above, indexed by type id
+        self._node_type_lookup = np.array(config.node_types, dtype=object)
+        self._edge_type_lookup = np.array(
+            config.relation_types, dtype=object
+        )
+
+        # Motif family (first letter of the motif name) -> builder
+        self._motif_handlers = {
+            "A": self._motif_A,
+            "B": self._motif_B,
+            "C": self._motif_C,
+        }
+
+        # Struct-of-arrays graph state (filled by generate())
+        self.node_type_ids = np.empty(0, dtype=np.int8)
+        self.attack_node = np.empty(0, dtype=np.uint8)
+        self.edge_index = np.empty((2, 0), dtype=np.int64)
+        self.edge_src, self.edge_dst = self.edge_index
+        self.edge_type_ids = np.empty(0, dtype=np.int8)
+        self.attack_edge = np.empty(0, dtype=np.uint8)
+
+        # (src, dst, edge_type, attack) chunks, flattened by
+        # _finalize_edges()
+        self._edge_chunks: List[Tuple[np.ndarray, ...]] = []
+
     # ==========================================================
     # PUBLIC API
     # ==========================================================
 
-    def generate(self) -> nx.DiGraph:
+    def generate(self):
         self._generate_nodes()
         self._generate_benign_edges()
 
         # MUCH larger number of attacks
-        num_attacks = random.randint(150, 300)
-        self.graph.graph["attack_instances"] = []
+        num_attacks = int(self.rng.integers(150, 300, endpoint=True))
+
+        attacks = [self._plan_attack() for _ in range(num_attacks)]
+        self._inject_attacks(attacks)
 
-        for _ in range(num_attacks):
-            self._inject_attack()
+        self._finalize_edges()
 
-        return self.graph
+    # Only built on demand (e.g. export_to_ultra); generation, analysis
+    # and to_pyg() all work on the arrays
+    def to_networkx(self) -> nx.DiGraph:
+        graph = nx.DiGraph()
+        graph.graph["attack_instances"] = self.attack_instances
+
+        node_types = self._node_type_lookup[self.node_type_ids]
+        edge_types = self._edge_type_lookup[self.edge_type_ids]
+
+        graph.add_nodes_from(
+            (n, {"node_type": t, "attack_node": a})
+            for n, (t, a) in enumerate(
+                zip(node_types.tolist(), self.attack_node.tolist())
+            )
+        )
+        graph.add_edges_from(
+            (u, v, {"edge_type": t, "attack_edge": a})
+            for u, v, t, a in zip(
+                self.edge_src.tolist(),
+                self.edge_dst.tolist(),
+                edge_types.tolist(),
+                self.attack_edge.tolist(),
+            )
+        )
+
+        return graph
 
     # ==========================================================
     # NODE GENERATION (SCALED UP)
     # ==========================================================
 
     def _generate_nodes(self):
-        for node_type, count in self.config.node_counts.items():
-            scaled_count = count * 5   # 🔥 scale nodes 5x
-            for _ in range(scaled_count):
-                self.graph.add_node(
-                    self.node_id_counter,
-                    node_type=node_type,
-                    attack_node=0,
-                )
-                self.node_id_counter += 1
+        node_types = list(self.config.node_counts)
+        scaled_counts = [
+            count * 5   # 🔥 scale nodes 5x
+            for count in self.config.node_counts.values()
+        ]
+
+        # Ids are assigned in contiguous blocks per type
+        for node_type, scaled_count in zip(node_types, scaled_counts):
+            start = self.node_id_counter
+            self._nodes_by_type.setdefault(node_type, []).extend(
+                range(start, start + scaled_count)
+            )
+            self.node_id_counter += scaled_count
+
+        self.node_type_ids = np.repeat(
+            np.array(
+                [self.node_type_encoding[t] for t in node_types],
+                dtype=np.int8,
+            ),
+            scaled_counts,
+        )
+        self.attack_node = np.zeros(self.node_id_counter, dtype=np.uint8)
 
     # ==========================================================
     # BENIGN EDGE GENERATION (DENSE + STRUCTURED)
     # ==========================================================
 
     def _generate_benign_edges(self):
-        nodes_by_type = self._group_nodes_by_type()
-
-        # 🔥 Increase edges massively
-        for relation in self.config.relation_types:
-            for _ in range(5000):
-                src = random.choice(list(self.graph.nodes))
-                dst = random.choice(list(self.graph.nodes))
-
-                if src != dst:
-                    self.graph.add_edge(
-                        src,
-                        dst,
-                        edge_type=relation,
-                        attack_edge=0,
-                    )
+        # 🔥 Increase edges massively (5000 per relation, one batch)
+        srcs, dsts, edge_types = _sample_edges(
+            self.rng,
+            self.node_id_counter,
+            len(self.config.relation_types),
+            5000,
+        )
+
+        self._add_edges(srcs, dsts, edge_types)
 
     # ==========================================================
     # ATTACK INJECTION (STRUCTURED + REPEATABLE)
     # ==========================================================
 
-    def _inject_attack(self):
-        motif = random.choice(self.config.attack_motif_definitions)
+    # Motifs are planned without touching the graph arrays and then
+    # written in one batch by _inject_attacks()
+    def _plan_attack(self) -> dict:
+        motifs = self.config.attack_motif_definitions
+        motif = motifs[self.rng.integers(len(motifs))]
 
         attack_nodes: List[int] = []
         attack_edges: List[Tuple[int, int]] = []
+        relations: List[str] = []
 
         def add_step(src, dst, relation):
-            self._add_edge(src, dst, relation, attack=True)
             attack_edges.append((src, dst))
             attack_nodes.append(dst)
+            relations.append(relation)
 
-        # -----------------------------
-        # STRONG PATTERN: repeated flows
-        # -----------------------------
+        self._motif_handlers[motif[0]](add_step)
 
-        if motif.startswith("A"):
-            user = self._get_random_node_by_type("Employee")
-            ws = self._get_random_node_by_type("Workstation")
-            server = self._get_random_node_by_type("Server")
+        return {
+            "nodes": attack_nodes,
+            "edges": attack_edges,
+            "relations": relations,
+        }
+
+    def _inject_attacks(self, attacks: List[dict]):
+        edges = [e for attack in attacks for e in attack["edges"]]
+        if edges:
+            srcs, dsts = zip(*edges)
+            self._add_edges(
+                srcs,
+                dsts,
+                [
+                    self.edge_type_encoding[r]
+                    for attack in attacks
+                    for r in attack["relations"]
+                ],
+                attack=True,
+            )
+
+        self._label_attack(
+            [n for attack in attacks for n in attack["nodes"]]
+        )
 
-            add_step(user, ws, "login_event")
-            add_step(ws, server, "net_flow")
+    # ==========================================================
+    # ATTACK MOTIFS (STRONG PATTERN: repeated flows)
+    # ==========================================================
 
-            # 🔥 repeatable escalation pattern
-            for _ in range(2):
-                proc = self._get_random_node_by_type("Process")
-                add_step(server, proc, "process_start")
+    def _motif_A(self, add_step):
+        user = self._get_random_node_by_type("Employee")
+        ws = self._get_random_node_by_type("Workstation")
+        server = self._get_random_node_by_type("Server")
+        procs = self._get_random_nodes_by_type("Process", 2)
+        file_nodes = self._get_random_nodes_by_type("File", 2)
 
-                file_node = self._get_random_node_by_type("File")
-                add_step(proc, file_node, "file_touch")
+        add_step(user, ws, "login_event")
+        add_step(ws, server, "net_flow")
 
-        elif motif.startswith("B"):
-            user = self._get_random_node_by_type("User")
-            host1 = self._get_random_node_by_type("Host")
-            host2 = self._get_random_node_by_type("Host")
+        # 🔥 repeatable escalation pattern
+        for proc, file_node in zip(procs, file_nodes):
+            add_step(server, proc, "process_start")
+            add_step(proc, file_node, "file_touch")
 
-            add_step(user, host1, "session_open")
-            add_step(host1, host2, "socket_connect")
+    def _motif_B(self, add_step):
+        user = self._get_random_node_by_type("User")
+        hosts = self._get_random_nodes_by_type("Host", 5)
 
-            # 🔥 consistent lateral movement
-            for _ in range(3):
-                next_host = self._get_random_node_by_type("Host")
-                add_step(host2, next_host, "socket_connect")
-                host2 = next_host
+        add_step(user, hosts[0], "session_open")
 
-        elif motif.startswith("C"):
-            identity = self._get_random_node_by_type("Identity")
-            vm = self._get_random_node_by_type("VM")
+        # 🔥 consistent lateral movement
+        for host, next_host in zip(hosts, hosts[1:]):
+            add_step(host, next_host, "socket_connect")
 
-            add_step(identity, vm, "auth_session")
+    def _motif_C(self, add_step):
+        identity = self._get_random_node_by_type("Identity")
+        vm = self._get_random_node_by_type("VM")
+        containers = self._get_random_nodes_by_type("Container", 4)
+        service = self._get_random_node_by_type("Microservice")
 
-            # 🔥 structured container chain
-            container = self._get_random_node_by_type("Container")
-            add_step(vm, container, "container_spawn")
+        add_step(identity, vm, "auth_session")
 
-            for _ in range(3):
-                next_container = self._get_random_node_by_type("Container")
-                add_step(container, next_container, "east_west_traffic")
-                container = next_container
+        # 🔥 structured container chain
+        add_step(vm, containers[0], "container_spawn")
 
-            service = self._get_random_node_by_type("Microservice")
-            add_step(container, service, "service_invocation")
+        for container, next_container in zip(containers, containers[1:]):
+            add_step(container, next_container, "east_west_traffic")
 
-        self._label_attack(attack_nodes, attack_edges)
+        add_step(containers[-1], service, "service_invocation")
 
     # ==========================================================
     # HELPERS
     # ==========================================================
 
-    def _group_nodes_by_type(self) -> Dict[str, List[int]]:
-        result = {}
-        for n, data in self.graph.nodes(data=True):
-            result.setdefault(data["node_type"], []).append(n)
-        return result
-
     def _get_random_node_by_type(self, node_type: str) -> int:
-        candidates = [
-            n for n, d in self.graph.nodes(data=True)
-            if d["node_type"] == node_type
-        ]
-        return random.choice(candidates)
-
-    def _add_edge(self, src, dst, relation, attack=False):
-        self.graph.add_edge(
-            src,
-            dst,
-            edge_type=relation,
-            attack_edge=int(attack),
+        bucket = self._nodes_by_type[node_type]
+        return bucket[self.rng.integers(len(bucket))]
+
+    # Distinct nodes of one type, so chains never revisit a hop
+    def _get_random_nodes_by_type(
+        self, node_type: str, count: int
+    ) -> List[int]:
+        bucket = self._nodes_by_type[node_type]
+        picks = self.rng.choice(len(bucket), size=count, replace=False)
+        return [bucket[i] for i in picks]
+
+    def _add_edges(self, srcs, dsts, edge_types, attack=False):
+        srcs = np.asarray(srcs, dtype=np.int64)
+
+        self._edge_chunks.append((
+            srcs,
+            np.asarray(dsts, dtype=np.int64),
+            np.broadcast_to(np.asarray(edge_types, dtype=np.int8), srcs.shape),
+            np.full(len(srcs), int(attack), dtype=np.uint8),
+        ))
+
+    def _label_attack(self, nodes):
+        # Attack edges carry attack_edge=1 from _add_edges already
+        self.attack_node[np.asarray(nodes, dtype=np.int64)] = 1
+
+    def _finalize_edges(self):
+        src, dst, etype, attack = (
+            np.concatenate(column) for column in zip(*self._edge_chunks)
         )
-
-    def _label_attack(self, nodes, edges):
-        for n in set(nodes):
-            self.graph.nodes[n]["attack_node"] = 1
-
-        for u, v in edges:
-            if self.graph.has_edge(u, v):
-                self.graph[u][v]["attack_edge"] = 1
+        self._edge_chunks.clear()
+
+        # Same semantics as nx.DiGraph.add_edge: one edge per (src, dst)
+        # carrying the attributes of its last write, listed in the order
+        # DiGraph.edges() yields (by source, then first insertion)
+        keys = src * self.node_id_counter + dst
+        _, first = np.unique(keys, return_index=True)
+        _, last = np.unique(keys[::-1], return_index=True)
+        last = len(keys) - 1 - last
+
+        order = np.lexsort((first, src[first]))
+        first = first[order]
+        last = last[order]
+
+        # edge_src / edge_dst are row views into one (2, M) buffer, so
+        # to_pyg can hand it to torch without stacking
+        self.edge_index = np.empty((2, len(first)), dtype=np.int64)
+        np.take(src, first, out=self.edge_index[0])
+        np.take(dst, first, out=self.edge_index[1])
+        self.edge_src, self.edge_dst = self.edge_index
+        self.edge_type_ids = etype[last]
+        self.attack_edge = attack[last]
 
     # ==========================================================
     # PyG EXPORT (LESS RANDOM, MORE SIGNAL)
     # ==========================================================
 
     def to_pyg(self) -> Data:
-        node_features = []
-        node_labels = []
-
-        num_types = len(self.node_type_encoding)
+        num_nodes = len(self.node_type_ids)
 
-        for _, data in self.graph.nodes(data=True):
-            feat = np.zeros(self.config.feature_dimensions)
-
-            # ✅ One-hot node type
-            type_idx = self.node_type_encoding[data["node_type"]]
-            feat[type_idx] = 1.0
-
-            # ❌ REMOVE THIS (LABEL LEAK)
-            # feat[1] = data["attack_node"]
-
-            node_features.append(feat)
-            node_labels.append(data["attack_node"])
-
-        x = np.array(node_features)
-
-        edge_index = []
-        edge_types = []
-        edge_labels = []
-
-        for u, v, data in self.graph.edges(data=True):
-            edge_index.append([u, v])
-            edge_types.append(self.edge_type_encoding[data["edge_type"]])
-            edge_labels.append(data["attack_edge"])
-
-        edge_index = torch.tensor(edge_index).t().contiguous()
+        # ✅ One-hot node type
+        # ❌ NO attack_node column (LABEL LEAK)
+        x = np.zeros(
+            (num_nodes, self.config.feature_dimensions), dtype=np.float32
+        )
+        x[np.arange(num_nodes), self.node_type_ids] = 1.0
 
         return Data(
-            x=torch.from_numpy(x).float(),
-            edge_index=edge_index,
-            edge_type=torch.tensor(edge_types),
-            y=torch.tensor(node_labels),
-            edge_label=torch.tensor(edge_labels),
+            x=torch.from_numpy(x),
+            edge_index=torch.from_numpy(self.edge_index),
+            edge_type=torch.from_numpy(self.edge_type_ids.astype(np.int64)),
+            y=torch.from_numpy(self.attack_node.astype(np.int64)),
+            edge_label=torch.from_numpy(self.attack_edge.astype(np.int64)),
         )
-
@@ -1,6 +1,4 @@
-import random
 import torch
-import numpy as np
 from config import (
     enterprise_A_config,
     enterprise_B_config,
@@ -14,23 +12,21 @@ def run_enterprise(cfg):
     print(f"\n\n######## {cfg.name} ########")
 
     gen = EnterpriseGraphGenerator(cfg)
-    graph = gen.generate()
+    gen.generate()
     pyg_data = gen.to_pyg()
 
     print("\nGraph Summary:")
-    print("Nodes:", graph.number_of_nodes())
-    print("Edges:", graph.number_of_edges())
+    print("Nodes:", len(gen.node_type_ids))
+    print("Edges:", len(gen.edge_type_ids))
     print("Attack Instances:",
-          len(graph.graph["attack_instances"]))
+          len(gen.attack_instances))
 
-    analyze_graph(graph, name=cfg.name)
+    analyze_graph(gen, name=cfg.name)
 
-    return graph, pyg_data
+    return gen, pyg_data
 
 
 torch.manual_seed(42)
-random.seed(42)
-np.random.seed(42)
 
 
 if __name__ == "__main__":
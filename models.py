@@ -38,6 +38,6 @@ class RelGraphSAGE(nn.Module):
         # add self node contribution
         out = out + self.lin_self(x)
 
-        out = F.relu(out)
+        out = F.relu_(out)
 
         return self.lin_out(out).squeeze(-1)
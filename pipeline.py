@@ -2,7 +2,7 @@ def main():
     config = build_default_config()
     generator = EnterpriseGraphGenerator(config)
 
-    graph = generator.generate()
+    generator.generate()
     data = generator.to_pyg()
 
     print("Graph generated:", data)
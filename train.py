@@ -1,29 +1,29 @@
+import math
+
 import torch
-import torch.nn.functional as F
-from sklearn.metrics import (
-    precision_score,
-    recall_score,
-    f1_score,
-    confusion_matrix,
-)
+from torch import nn
 
 
 
 def train(model, data, epochs=50, lr=0.01):
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model.to(device)
+    data = data.to(device)
+
     optimizer = torch.optim.Adam(model.parameters(), lr=lr)
 
+    # labels don't change across epochs: cast and weight them once
+    y_float = data.y.float()
+    num_pos = y_float.sum()
+    pos_weight = (len(y_float) - num_pos) / num_pos.clamp_min(1)
+    loss_fn = nn.BCEWithLogitsLoss(pos_weight=pos_weight)
+
     model.train()
     for epoch in range(epochs):
         optimizer.zero_grad()
 
         logits = model(data.x, data.edge_index, data.edge_type)
-        pos_weight = (len(data.y) - data.y.sum()) / data.y.sum()
-        
-        loss = F.binary_cross_entropy_with_logits(
-            logits,
-            data.y.float(),
-            pos_weight=pos_weight
-        )
+        loss = loss_fn(logits, y_float)
 
         loss.backward()
         optimizer.step()
@@ -33,19 +33,23 @@ def train(model, data, epochs=50, lr=0.01):
 
 
 def evaluate(model, data, name="Dataset"):
+    device = next(model.parameters()).device
+    data = data.to(device)
+
     model.eval()
     with torch.no_grad():
         logits = model(data.x, data.edge_index, data.edge_type)
-        probs = torch.sigmoid(logits)
-        preds = (probs > 0.2).int()
+        # sigmoid(logits) > 0.2  <=>  logits > logit(0.2)
+        preds = (logits > math.log(0.2 / 0.8)).long()
 
-    y_true = data.y.cpu().numpy()
-    y_pred = preds.cpu().numpy()
+    # [[tn, fp], [fn, tp]], same layout as sklearn's confusion_matrix
+    cm = torch.bincount(2 * data.y.long() + preds, minlength=4)
+    cm = cm.view(2, 2).cpu().numpy()
+    (tn, fp), (fn, tp) = cm.tolist()
 
-    precision = precision_score(y_true, y_pred, zero_division=0)
-    recall = recall_score(y_true, y_pred, zero_division=0)
-    f1 = f1_score(y_true, y_pred, zero_division=0)
-    cm = confusion_matrix(y_true, y_pred)
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * tp / (2 * tp + fp + fn) if tp + fp + fn else 0.0
 
     print(f"\n===== Evaluation on {name} =====")
     print(f"Precision: {precision:.4f}")